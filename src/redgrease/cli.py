@@ -30,7 +30,7 @@ THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR I
 import logging
 import pathlib
 import re
-import time
+import signal
 
 import configargparse
 
@@ -137,6 +137,14 @@ args.add_argument(
     "unnecessarily loaded during coding. "
     "If no value is supplied, the duration is defaulting to 5 seconds.",
 )
+args.add_argument(
+    "--poll",
+    env_var="POLL",
+    action="store_true",
+    help="Monitor files by polling, instead of using native file system "
+    "notifications. Only needed if the native notifications are unavailable, e.g. "
+    "on some network mounts.",
+)
 args.add_argument(
     "-s",
     "--server",
@@ -186,6 +194,7 @@ def main():
         server=config.server,
         port=config.port,
         observe=config.watch,
+        poll=config.poll,
     )
 
     for path in config.paths:
@@ -199,15 +208,27 @@ def main():
     if loader.observer:
         log.info("Starting directory observer!")
         loader.start()
-        running = True
+        stopping = False
+
+        def shutdown(signum, frame):
+            nonlocal stopping
+            log.warning("Received signal %s. Ending!", signal.Signals(signum).name)
+            stopping = True
+            loader.stop()
+
+        signal.signal(signal.SIGINT, shutdown)
+        signal.signal(signal.SIGTERM, shutdown)
 
         try:
-            while running:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            log.warning("Interrupted by user. Ending!")
+            # Ends as soon as the observer ends, whether stopped or failed.
+            # Joined with a timeout, so that Ctrl-C is handled on all platforms.
+            while loader.observer.is_alive():
+                loader.join(1.0)
+            if not stopping:
+                raise RuntimeError("Directory observer ended unexpectedly")
         finally:
             loader.stop()
+            loader.redis.close()
 
 
 if __name__ == "__main__":
@@ -548,7 +548,7 @@ class Gears:
 
         if requirements:
             params.append("REQUIREMENTS")
-            params += list(map(str, requirements))
+            params += sorted(map(str, requirements))
 
         try:
             command_response = self._redis.execute_command(
@@ -30,9 +30,11 @@ import configparser
 import json
 import logging
 import logging.config
+import math
 import pathlib
+import time
 from datetime import datetime
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 import yaml
 import yaml.error
@@ -49,13 +51,32 @@ class UTC_ISO8601_Formatter(logging.Formatter):
 
     converter = datetime.utcfromtimestamp  # type: ignore
 
+    # Formatted date and time, down to the second, of the last formatted record,
+    # as a (seconds, string) tuple. Records tend to come in bursts.
+    _last_second: Tuple[Optional[int], str] = (None, "")
+
     def formatTime(self, record, datefmt=None):
-        ct = self.converter(record.created)
-        if datefmt:
-            s = ct.strftime(datefmt)
-        else:
-            s = ct.strftime(iso8601_datefmt)
-        return s
+        # The cached formatting below assumes the default converter
+        if datefmt or self.converter != datetime.utcfromtimestamp:
+            return self.converter(record.created).strftime(datefmt or iso8601_datefmt)
+
+        # Microseconds rounded half to even, as by `datetime.utcfromtimestamp`
+        fraction, whole_seconds = math.modf(record.created)
+        microseconds = round(fraction * 1e6)
+        if microseconds >= 1000000:
+            whole_seconds += 1
+            microseconds -= 1000000
+        elif microseconds < 0:
+            whole_seconds -= 1
+            microseconds += 1000000
+
+        seconds = int(whole_seconds)
+        last_seconds, formatted_seconds = self._last_second
+        if seconds != last_seconds:
+            formatted_seconds = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+            self._last_second = (seconds, formatted_seconds)
+
+        return f"{formatted_seconds}.{microseconds:06d}"
 
 
 log_message_format = (
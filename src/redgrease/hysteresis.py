@@ -34,8 +34,11 @@ THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR I
 """
 
 
-from threading import Timer
-from typing import Callable, Dict, Hashable, Optional
+from threading import Lock, Timer
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+SignalHandler = Tuple[Callable[..., None], Tuple[Any, ...], Dict[str, Any]]
+"""Type alias for a pending signal handler function and its arguments."""
 
 
 def nop(*args, **kwargs):
@@ -159,3 +162,84 @@ class HysteresisHandlerIndex:
         self.handlers[handler_id].set(
             self.hysteresis_duration, handler_function, *handler_args, **handler_kwargs
         )
+
+
+class HysteresisHandlerBatch:
+    """
+    Batch of multiple signal handlers for different signals, triggering all pending
+    handlers together, only when no signal at all has been registered for a set
+    amount of time.
+
+    As opposed to the `HysteresisHandlerIndex`, where each handler has its own timer,
+    this is useful when the handlers are cheaper to process together than one by one.
+    For example loading many files that were all modified at roughly the same time,
+    e.g. by a version control checkout.
+    """
+
+    def __init__(
+        self,
+        hysteresis_duration: Optional[float] = 1.0,
+        batch_handler: Optional[Callable[[List[SignalHandler]], None]] = None,
+    ):
+        """Initialize the Batch.
+
+        Args:
+            hysteresis_duration (float, optional):
+                The required number of seconds without any signals for the pending
+                handlers to trigger.
+                Defaults to 1.0 second.
+
+            batch_handler (Callable[[List[SignalHandler]], None], optional):
+                Function called with the list of pending handlers, and their
+                arguments, when triggered.
+                Defaults to None, meaning that each pending handler is simply called,
+                in the order their signals were first registered.
+        """
+        self.hysteresis_duration = hysteresis_duration
+        self.batch_handler = batch_handler
+        self.pending: Dict[Hashable, SignalHandler] = {}
+        self.timer = ResettableTimer()
+        self._lock = Lock()
+
+    def signal(
+        self,
+        handler_id: Hashable,
+        handler_function: Callable[..., None],
+        *handler_args,
+        **handler_kwargs
+    ):
+        """Register a new signal for a specific handler.
+        Any previously pending handler with the same id is replaced.
+
+        Args:
+            handler_id ([Hashable]):
+                Id / name of the handler / signal / event.
+
+            handler_function (Callable[..., None]):
+                Signal handler function.
+
+            *handler_args (Any):
+                Any additional arguments for the handler, when triggered.
+
+            **handler_kwargs (Any):
+                Any additional keword arguments for the handler, when triggered.
+        """
+        with self._lock:
+            self.pending[handler_id] = (handler_function, handler_args, handler_kwargs)
+            self.timer.set(self.hysteresis_duration, self.trigger)
+
+    def trigger(self):
+        """Trigger all pending handlers immediately. Will cancel the timer."""
+        with self._lock:
+            self.timer.cancel()
+            handlers = list(self.pending.values())
+            self.pending = {}
+
+        if not handlers:
+            return
+
+        if self.batch_handler:
+            self.batch_handler(handlers)
+        else:
+            for handler_function, handler_args, handler_kwargs in handlers:
+                handler_function(*handler_args, **handler_kwargs)
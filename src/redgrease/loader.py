@@ -28,19 +28,43 @@ THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR I
  OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
+import fnmatch
+import functools
+import hashlib
 import logging
+import os
 import re
+import stat
 from datetime import datetime
-from fnmatch import fnmatch
-from os.path import isfile
 from pathlib import Path
-from typing import List, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from redis.exceptions import RedisError, ResponseError
 from watchdog.events import PatternMatchingEventHandler
 from watchdog.observers import Observer
+from watchdog.observers.api import BaseObserver
+from watchdog.observers.polling import PollingObserver
 
-from redgrease import RedisGears, formatting, hysteresis, requirements
+from redgrease import RedisCluster, RedisGears, formatting, hysteresis, requirements
+
+try:
+    from rediscluster.exceptions import RedisClusterException
+
+    # Cluster errors are not derived from RedisError
+    _redis_errors: Tuple[Type[Exception], ...] = (RedisError, RedisClusterException)
+except ModuleNotFoundError:
+    _redis_errors = (RedisError,)
 
 log = logging.getLogger(__name__)
 
@@ -65,6 +89,26 @@ default_ignore_patterns: List[str] = ["_*"]
 _regex_type = type(re.compile(""))
 
 
+@functools.lru_cache(maxsize=8)
+def _glob_regex(pattern: str):
+    """Compile a glob-style pattern to a case-insensitive regex, as per `fnmatch`.
+
+    Matching is case-insensitive, in line with the loader's file event handler.
+    Compiled patterns are cached, so that the translation is only done once per
+    pattern and process.
+
+    Args:
+        pattern (str):
+            Glob-style pattern, e.g. `*.py`.
+
+    Returns:
+        re.Pattern:
+            Compiled regex, matching the same strings as the pattern, regardless
+            of case.
+    """
+    return re.compile(fnmatch.translate(pattern), re.IGNORECASE)
+
+
 def fail(exception, *messages):
     """Convenience function for raising exceptions
 
@@ -85,6 +129,43 @@ def fail(exception, *messages):
     raise exception(error_message)
 
 
+class _CommandQueue:
+    """Stand-in for a non-transactional pipeline, that executes the queued commands
+    one by one, when executed.
+
+    Used with cluster clients, as cluster pipelines cannot route the keyless
+    Gears commands.
+    """
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands: List[Tuple[Callable, tuple, dict]] = []
+
+    def execute_command(self, *args, **kwargs):
+        self.commands.append((self.redis.execute_command, args, kwargs))
+
+    def hget(self, *args, **kwargs):
+        self.commands.append((self.redis.hget, args, kwargs))
+
+    def hset(self, *args, **kwargs):
+        self.commands.append((self.redis.hset, args, kwargs))
+
+    def delete(self, *args, **kwargs):
+        self.commands.append((self.redis.delete, args, kwargs))
+
+    def execute(self, raise_on_error: bool = True) -> List[Any]:
+        commands, self.commands = self.commands, []
+        results: List[Any] = []
+        for command, args, kwargs in commands:
+            try:
+                results.append(command(*args, **kwargs))
+            except _redis_errors as ex:
+                if raise_on_error:
+                    raise
+                results.append(ex)
+        return results
+
+
 class GearsLoader:
     """Monitors and loads one or more script files into Redis Gear cluster.
 
@@ -104,6 +185,7 @@ class GearsLoader:
         server: str = "localhost",
         port: int = 6379,
         observe: float = None,
+        poll: bool = False,
         **redis_kwargs,
     ):
         """Instantiate a Gears Loader
@@ -147,6 +229,14 @@ class GearsLoader:
                 changes.
                 If `False`, the files will only be loaded when added to the Loader.
                 Defaults to None.
+
+            poll (bool, optional):
+                If `True`, observe the files by periodically polling them, instead of
+                using the native file system notifications of the platform (e.g.
+                inotify or FSEvents).
+                Only useful where native notifications are not available, e.g. for
+                some network or container mounted file systems.
+                Defaults to False.
         """
         self.directories: List[Path] = []
 
@@ -160,6 +250,10 @@ class GearsLoader:
             else default_requirements_pattern
         )
 
+        # Translate the glob patterns once, instead of on every file event
+        self._script_regex = _glob_regex(self.script_pattern)
+        self._requirements_regex = _glob_regex(self.requirements_pattern)
+
         if unblocking_pattern is None:
             unblocking_pattern = default_unblocking_pattern
         if isinstance(unblocking_pattern, str):
@@ -176,16 +270,47 @@ class GearsLoader:
 
         self.redis = RedisGears(host=server, port=port, **redis_kwargs)
 
-        self.observer = Observer() if observe else None
+        # Registration id (if any) of each script loaded by this loader,
+        # mirroring the index in Redis.
+        self._script_registrations: Dict[str, Optional[str]] = {}
+
+        # Content hash of each script, as last successfully loaded by this loader
+        self._script_hashes: Dict[str, bytes] = {}
 
-        self.file_index = hysteresis.HysteresisHandlerIndex(hysteresis_duration=observe)
+        # Requirements last loaded from each requirements file
+        self._requirements: Dict[str, FrozenSet[str]] = {}
+
+        # Parsed requirements of each requirements file, and the file
+        # modification time and size they were parsed at
+        self._parsed_requirements: Dict[
+            str, Tuple[Tuple[int, int], FrozenSet[str]]
+        ] = {}
+
+        self.observer: Optional[BaseObserver] = None
+        if observe:
+            if poll:
+                self.observer = PollingObserver()
+            else:
+                self.observer = Observer()
+                if isinstance(self.observer, PollingObserver):
+                    log.warning(
+                        "No native file system notifications available. "
+                        "Falling back to polling, which may be slow for large "
+                        "directories."
+                    )
+
+        # Events are batched, so that bursts of modifications to many files,
+        # e.g. from a 'git pull', are loaded together
+        self.file_index = hysteresis.HysteresisHandlerBatch(
+            hysteresis_duration=observe, batch_handler=self.handle_batch
+        )
 
         # Create the file change event listener
         self.event_handler = (
             PatternMatchingEventHandler(
                 patterns=[self.script_pattern, self.requirements_pattern],
                 ignore_patterns=self.ignore_patterns,
-                ignore_directories=False,
+                ignore_directories=True,
                 case_sensitive=False,
             )
             if self.observer
@@ -201,19 +326,19 @@ class GearsLoader:
         try:
             self.redis.close()
         except RedisError as ex:
-            log.warn(f"Error while closing redis: {ex}")
+            log.warning("Error while closing redis: %s", ex)
 
         try:
             self.stop()
         except Exception as ex:
-            log.warn(f"Error stopping observer: {ex}")
+            log.warning("Error stopping observer: %s", ex)
             raise
 
     def add_file(self, file: Union[Path, str]) -> None:
         if not isinstance(file, Path):
             file = Path(str(file))
 
-        if fnmatch(file.name, self.requirements_pattern):
+        if self.is_requirements(file.name):
             self.update_dependencies(file)
         else:
             self.register_script(file)
@@ -223,6 +348,32 @@ class GearsLoader:
 
             self.directories.append(file)
 
+    def is_script(self, path: Union[Path, str]) -> bool:
+        """Check if a path matches the script pattern.
+
+        Args:
+            path (Union[Path, str]):
+                File path or name.
+
+        Returns:
+            bool:
+                `True` if the path matches the script pattern, `False` otherwise.
+        """
+        return self._script_regex.match(str(path)) is not None
+
+    def is_requirements(self, path: Union[Path, str]) -> bool:
+        """Check if a path matches the requirements pattern.
+
+        Args:
+            path (Union[Path, str]):
+                File path or name.
+
+        Returns:
+            bool:
+                `True` if the path matches the requirements pattern, `False` otherwise.
+        """
+        return self._requirements_regex.match(str(path)) is not None
+
     def add_directory(
         self, directory: Union[Path, str], recursive: bool = False
     ) -> None:
@@ -235,28 +386,92 @@ class GearsLoader:
             recursive (bool, optional):
                 Recursively scan sub-directories.
                 Defaults to False.
+
+        Script files that cannot be read, e.g. empty ones, are skipped, and the
+        error is logged.
         """
         if not isinstance(directory, Path):
             directory = Path(str(directory))
 
-        log.info(f"Adding event handlers for {directory}")
+        log.info("Adding event handlers for %s", directory)
 
         # select either recursive or non-recursive glob function for the dir
         globber = directory.rglob if recursive else directory.glob
 
-        # find and run/register all requirements files in the watch directories
-        for requirements_file_path in globber(self.requirements_pattern):
+        # find all script and requirements files in the watch directory,
+        # matched the same way as the file events
+        script_paths = []
+        requirements_file_paths = []
+        for path in globber("*"):
+            if not path.is_file():
+                continue
+            if self.is_script(path):
+                script_paths.append(path)
+            elif self.is_requirements(path):
+                requirements_file_paths.append(path)
+
+        # run/register all requirements files in the watch directories
+        for requirements_file_path in requirements_file_paths:
             self.update_dependencies(requirements_file_path)
 
-        # find and run/register all script files in the watch directory
-        for script_file_path in globber(self.script_pattern):
-            self.register_script(script_file_path)
+        # run/register all script files in the watch directory
+        self.register_scripts(*script_paths)
 
         if self.observer is not None:
-            self.observer.schedule(self.event_handler, directory, recursive)
+            self.observer.schedule(self.event_handler, directory, recursive=recursive)
 
         self.directories.append(directory)
 
+    def read_script(self, script_path) -> bytes:
+        """Read the raw contents of a gear script file.
+
+        Args:
+            script_path (str):
+                Path to the script.
+
+        Returns:
+            bytes:
+                The script contents, as is, without decoding.
+
+        Raises:
+            FileNotFoundError:
+                If the script file does not exist.
+
+            IOError:
+                If the script file is empty.
+
+        Errors are raised without being logged, and left to the caller to handle.
+        """
+        # A single open, for both checking and reading the file.
+        # Non-blocking, so that opening e.g. a FIFO does not wait for a writer.
+        try:
+            fd = os.open(script_path, os.O_RDONLY | getattr(os, "O_NONBLOCK", 0))
+        except FileNotFoundError:
+            raise FileNotFoundError("File not found")
+
+        try:
+            file_stat = os.fstat(fd)
+            if not stat.S_ISREG(file_stat.st_mode):
+                raise FileNotFoundError("File not found")
+
+            # A single read may return less than requested
+            chunks = []
+            remaining = file_stat.st_size
+            while remaining > 0:
+                chunk = os.read(fd, remaining)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                remaining -= len(chunk)
+            script_content = b"".join(chunks)
+        finally:
+            os.close(fd)
+
+        if not script_content:
+            raise IOError("File is empty")
+
+        return script_content
+
     # TODO: Should call pyexecute with the file path directly
     # TODO: Handle multiple registrations per script.
     def register_script(self, script_path):
@@ -270,63 +485,233 @@ class GearsLoader:
                 Path to the script.
 
         """
-        log.debug(f"Registering script '{script_path}'")
-        general_failure_msg = f"Unable to register script file '{script_path}'"
+        log.debug("Registering script '%s'", script_path)
+        try:
+            script_content = self.read_script(script_path)
+        except OSError as ex:
+            log.error("Unable to register script file '%s': %s", script_path, ex)
+            raise
 
-        if not isfile(script_path):
-            fail(FileNotFoundError, general_failure_msg, "File not found")
+        self._register([(script_path, script_content)])
 
-        with open(script_path) as script_file:
-            script_content = script_file.read()
+    def register_scripts(self, *script_paths):
+        """Execute / Register multiple gear scripts in redis using 'RG.PYEXECUTE'.
 
-        if not script_content:
-            fail(IOError, general_failure_msg, "File is empty")
+        All scripts are sent to the server in a single pipeline.
+        Scripts that cannot be read, e.g. because they are missing, empty or not
+        accessible, are skipped, and the error is logged.
 
-        # Unregister script if already present
-        self.unregister_script(script_path)
+        Args:
+            *script_paths (str):
+                Paths to the scripts.
+        """
+        scripts = []
+        for script_path in script_paths:
+            log.debug("Registering script '%s'", script_path)
+            try:
+                scripts.append((script_path, self.read_script(script_path)))
+            except OSError as ex:
+                log.error("Unable to register script file '%s': %s", script_path, ex)
+                continue
 
-        unblocking = self.unblocking_pattern.search(str(script_path)) is not None
+        self._register(scripts)
 
-        try:
-            log.debug(
-                f"Running/registering Gear script '{script_path}' " "on Redis server"
-            )
+    def _register(self, scripts: List[Tuple[Any, bytes]]):
+        """Execute / Register gear scripts, and index any resulting registrations.
+
+        Each 'RG.PYEXECUTE' is followed by a 'RG.DUMPREGISTRATIONS' in the same
+        pipeline, so that new registrations can be attributed to the right script.
+        The pipeline starts with a 'RG.DUMPREGISTRATIONS' as baseline, followed by the
+        de-registration of any previous registrations of the scripts.
 
+        Args:
+            scripts (List[Tuple[Any, bytes]]):
+                Script paths and their corresponding contents.
+        """
+        changed_scripts = self._changed_scripts(scripts)
+        if not changed_scripts:
+            return
+
+        try:
             # This is a quite unsafe way of checking for registrations
             # Probably Ok for dev situations in non-shared environments
-            pre_reg = self.redis.gears.dumpregistrations()
-            exec_res = self.redis.gears.pyexecute(script_content, unblocking=unblocking)
-            ret = f"with return code '{exec_res}'."
-            post_reg = self.redis.gears.dumpregistrations()
-            pre_reg = set([reg.id for reg in pre_reg])
-            log.debug(f"Pre regs: {list(pre_reg)}")
-            post_reg = set([reg.id for reg in post_reg])
-            log.debug(f"Post regs: {list(post_reg)}")
-            diff_reg: set = post_reg - pre_reg
-            if len(diff_reg) > 0:
-                reg_id = diff_reg.pop()
-                self.redis.hset(
-                    f"{self.index_prefix}{script_path}",
-                    mapping={
-                        "registration_id": str(reg_id),
-                        "last_updated": datetime.utcnow().strftime(
-                            formatting.iso8601_datefmt
-                        ),
-                    },
+            # The baseline is dumped in the same pipeline, rather than cached between
+            # loads, as a cached baseline goes stale as soon as anyone else
+            # registers anything, and their registration would be attributed to
+            # the script. 'RG.PYEXECUTE' does not return the registration id.
+            self._fetch_registrations(
+                script_path for script_path, *_ in changed_scripts
+            )
+            pipe = self._pipeline()
+            pipe.execute_command("RG.DUMPREGISTRATIONS")
+
+            # Unregister scripts if already present
+            unregistered = [
+                self._queue_unregister(pipe, script_path)
+                for script_path, *_ in changed_scripts
+            ]
+
+            for script_path, script_content, _ in changed_scripts:
+                log.debug(
+                    "Running/registering Gear script '%s' on Redis server", script_path
                 )
-                log.debug(f"Script '{script_path}' registered as '{reg_id}' {ret}")
-            else:
-                log.debug(f"Script '{script_path}' executed {ret}")
-
-            if len(diff_reg) > 0:
-                log.warning(
-                    "Multiple registrations occurred? "
-                    "Index might be corrupt. "
-                    "Is this a shared environment?"
+                unblocking = self.unblocking_pattern.search(str(script_path))
+                params = ["UNBLOCKING"] if unblocking else []
+                pipe.execute_command("RG.PYEXECUTE", script_content, *params)
+                pipe.execute_command("RG.DUMPREGISTRATIONS")
+            results = pipe.execute(raise_on_error=False)
+
+            pre_reg = self._registration_ids(results.pop(0))
+
+            for reg_id in unregistered:
+                if reg_id is not None:
+                    self._check_unregister(results.pop(0))
+                results.pop(0)  # Index deletion
+
+            index_pipe = self._pipeline()
+            timestamp = datetime.utcnow().strftime(formatting.iso8601_datefmt)
+            for (script_path, _, content_hash), exec_res, post_reg in zip(
+                changed_scripts, results[0::2], results[1::2]
+            ):
+                if isinstance(post_reg, Exception):
+                    # The registrations can no longer be reliably attributed
+                    log.error("Something went wrong: %s", post_reg)
+                    break
+
+                post_reg = self._registration_ids(post_reg)
+                self._index_registration(
+                    index_pipe, script_path, exec_res, pre_reg, post_reg, timestamp
                 )
+                pre_reg = post_reg
+                if not isinstance(exec_res, Exception):
+                    self._script_hashes[str(script_path)] = content_hash
 
-        except RedisError as ex:
-            log.error(f"Something went wrong: {ex}")
+            index_pipe.execute()
+
+        except _redis_errors as ex:
+            log.error("Something went wrong: %s", ex)
+
+    def _pipeline(self):
+        """Create a non-transactional pipeline for the Redis client.
+
+        Cluster clients get a `_CommandQueue` instead, executing the commands one by
+        one, as cluster pipelines cannot route the keyless Gears commands.
+
+        Returns:
+            Union[redis.client.Pipeline, _CommandQueue]:
+                The pipeline.
+        """
+        # Ensure that the Gears response callbacks are set, before the pipeline
+        # copies them from the client
+        self.redis.gears
+
+        if isinstance(self.redis, RedisCluster):
+            return _CommandQueue(self.redis)
+        return self.redis.pipeline(transaction=False)
+
+    @staticmethod
+    def _registration_ids(dump_res) -> Set:
+        """Extract the registration ids from a (pipelined) 'RG.DUMPREGISTRATIONS'.
+
+        Args:
+            dump_res (Any):
+                The response of the command, or the exception if it failed.
+
+        Returns:
+            Set:
+                The registration ids.
+
+        Raises:
+            redis.exceptions.RedisError:
+                If the command failed.
+        """
+        if isinstance(dump_res, Exception):
+            raise dump_res
+        return {reg.id for reg in dump_res}
+
+    def _changed_scripts(
+        self, scripts: List[Tuple[Any, bytes]]
+    ) -> List[Tuple[Any, bytes, bytes]]:
+        """Filter out scripts with the same contents as when last registered.
+
+        Args:
+            scripts (List[Tuple[Any, bytes]]):
+                Script paths and their corresponding contents.
+
+        Returns:
+            List[Tuple[Any, bytes, bytes]]:
+                Paths, contents and content hashes of the changed scripts.
+        """
+        changed_scripts = []
+        for script_path, script_content in scripts:
+            content_hash = hashlib.blake2b(script_content, digest_size=16).digest()
+            if self._script_hashes.get(str(script_path)) == content_hash:
+                log.debug("Script '%s' unchanged. Ignoring.", script_path)
+                continue
+            changed_scripts.append((script_path, script_content, content_hash))
+        return changed_scripts
+
+    def _index_registration(
+        self, pipe, script_path, exec_res, pre_reg, post_reg, timestamp
+    ):
+        """Add the index update for any new registration, from the execution of a
+        script, to a pipeline.
+
+        Args:
+            pipe (Union[redis.client.Pipeline, _CommandQueue]):
+                Pipeline to add the index update to.
+
+            script_path (str):
+                Path to the executed script.
+
+            exec_res (Any):
+                The response of the execution, or the exception if it failed.
+
+            pre_reg (Set):
+                Registration ids before the execution.
+
+            post_reg (Set):
+                Registration ids after the execution.
+
+            timestamp (str):
+                Time of the execution.
+        """
+        if isinstance(exec_res, Exception):
+            log.error("Unable to register script file '%s': %s", script_path, exec_res)
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Pre regs: %s", list(pre_reg))
+            log.debug("Post regs: %s", list(post_reg))
+
+        diff_reg: set = post_reg - pre_reg
+        if len(diff_reg) > 1:
+            log.warning(
+                "Multiple registrations occurred? "
+                "Index might be corrupt. "
+                "Is this a shared environment?"
+            )
+
+        self._script_registrations[str(script_path)] = None
+        if diff_reg:
+            reg_id = diff_reg.pop()
+            self._script_registrations[str(script_path)] = str(reg_id)
+            pipe.hset(
+                f"{self.index_prefix}{script_path}",
+                mapping={
+                    "registration_id": str(reg_id),
+                    "last_updated": timestamp,
+                },
+            )
+            log.debug(
+                "Script '%s' registered as '%s' with return code '%s'.",
+                script_path,
+                reg_id,
+                exec_res,
+            )
+        else:
+            log.debug(
+                "Script '%s' executed with return code '%s'.", script_path, exec_res
+            )
 
     # Actions
     # TODO: Should call pyexecute with the file path directly
@@ -339,24 +724,84 @@ class GearsLoader:
             script_path (str):
                 Script path
         """
-        log.debug(f"De-registering script: '{script_path}'")
+        self._fetch_registrations([script_path])
+        pipe = self._pipeline()
+        reg_id = self._queue_unregister(pipe, script_path)
+        results = pipe.execute(raise_on_error=False)
+        if reg_id is not None:
+            self._check_unregister(results[0])
+
+    def _fetch_registrations(self, script_paths):
+        """Fetch the indexed registration ids of scripts that are not (yet) loaded
+        by this loader, but may have been by a previous one.
+
+        The ids of all the scripts are fetched in a single pipeline.
+
+        Args:
+            script_paths (Iterable[str]):
+                Script paths
+        """
+        uncached = [
+            script_path
+            for script_path in script_paths
+            if str(script_path) not in self._script_registrations
+        ]
+        if not uncached:
+            return
+
+        pipe = self._pipeline()
+        for script_path in uncached:
+            pipe.hget(f"{self.index_prefix}{script_path}", "registration_id")
+        for script_path, reg_id in zip(uncached, pipe.execute()):
+            self._script_registrations[str(script_path)] = reg_id
+
+    def _queue_unregister(self, pipe, script_path):
+        """Add the de-registration of a script, if registered, and the removal of
+        its index entry, to a pipeline.
+
+        The registration id of the script must have been fetched, using
+        `_fetch_registrations`.
+
+        Args:
+            pipe (Union[redis.client.Pipeline, _CommandQueue]):
+                Pipeline to add the commands to.
+
+            script_path (str):
+                Script path
+
+        Returns:
+            Optional[str]:
+                The registration id to be unregistered, if any.
+                If not `None`, the first command added is the 'RG.UNREGISTER'.
+        """
+        log.debug("De-registering script: '%s'", script_path)
         reg_key = f"{self.index_prefix}{script_path}"
-        reg_id = self.redis.hget(reg_key, "registration_id")
+        self._script_hashes.pop(str(script_path), None)
+        reg_id = self._script_registrations.pop(str(script_path), None)
         if reg_id is not None:
             log.debug(
-                f"Removing registration for script '{script_path}' "
-                f"with id '{reg_id}'"
+                "Removing registration for script '%s' with id '%s'",
+                script_path,
+                reg_id,
             )
-            try:
-                self.redis.gears.unregister(reg_id)
-            except ResponseError as err:
-                log.warn(
-                    "De-registration failed. "
-                    "Index might be corrupt. "
-                    "Is this a shared environment?"
-                )
-                log.error({err})
-        self.redis.delete(reg_key)
+            pipe.execute_command("RG.UNREGISTER", reg_id)
+        pipe.delete(reg_key)
+        return reg_id
+
+    def _check_unregister(self, unregister_res):
+        """Log any failure of a (pipelined) 'RG.UNREGISTER'.
+
+        Args:
+            unregister_res (Any):
+                The response of the command, or the exception if it failed.
+        """
+        if isinstance(unregister_res, ResponseError):
+            log.warning(
+                "De-registration failed. "
+                "Index might be corrupt. "
+                "Is this a shared environment?"
+            )
+            log.error(unregister_res)
 
     def update_dependencies(self, requirements_file_path):
         """Update (add only) package dependencies on the Redis instance
@@ -365,13 +810,71 @@ class GearsLoader:
             requirements_file_path (str):
                 File path of 'requirements.txt' file.
         """
-        log.debug(f"Updating dependencies as per '{requirements_file_path}'")
+        log.debug("Updating dependencies as per '%s'", requirements_file_path)
         try:
-            requirements_set = requirements.read_requirements(requirements_file_path)
-            log.debug(f"Requirements to load: {', '.join(map(str, requirements_set))}")
+            requirements_set = self._read_requirements(requirements_file_path)
+            if self._requirements.get(str(requirements_file_path)) == requirements_set:
+                log.debug(
+                    "Requirements in '%s' unchanged. Ignoring.", requirements_file_path
+                )
+                return
+            log.debug("Requirements to load: %s", ", ".join(sorted(requirements_set)))
             self.redis.gears.pyexecute(requirements=requirements_set)
+            self._requirements[str(requirements_file_path)] = requirements_set
         except Exception as ex:
-            log.error(f"Something went wrong: {ex}")
+            log.error("Something went wrong: %s", ex)
+
+    def _read_requirements(self, requirements_file_path) -> FrozenSet[str]:
+        """Read the requirements of a requirements file.
+
+        The parsed requirements are cached, and only re-read if the modification
+        time or size of the file has changed.
+
+        Args:
+            requirements_file_path (str):
+                File path of 'requirements.txt' file.
+
+        Returns:
+            FrozenSet[str]:
+                The requirements in the file.
+        """
+        file_stat = os.stat(requirements_file_path)
+        file_version = (file_stat.st_mtime_ns, file_stat.st_size)
+        cached = self._parsed_requirements.get(str(requirements_file_path))
+        if cached and cached[0] == file_version:
+            return cached[1]
+
+        requirements_set = frozenset(
+            map(str, requirements.read_requirements(requirements_file_path))
+        )
+        self._parsed_requirements[str(requirements_file_path)] = (
+            file_version,
+            requirements_set,
+        )
+        return requirements_set
+
+    def handle_batch(self, handlers: List[hysteresis.SignalHandler]):
+        """Handle a batch of pending file actions.
+
+        Requirements are updated and scripts are unregistered first, after which
+        all scripts to (re-)register are registered together.
+        A failing action is logged, and does not prevent the remaining ones.
+
+        Args:
+            handlers (List[hysteresis.SignalHandler]):
+                Pending actions, i.e. loader methods and their arguments.
+        """
+        script_paths: List[Any] = []
+        for handler_function, handler_args, handler_kwargs in handlers:
+            if handler_function == self.register_script:
+                script_paths.extend(handler_args)
+                continue
+            try:
+                handler_function(*handler_args, **handler_kwargs)
+            except Exception as ex:
+                log.error("Something went wrong: %s", ex)
+
+        self.register_scripts(*script_paths)
 
     # File Event Handling
     def on_deleted(self, event):
@@ -386,22 +889,22 @@ class GearsLoader:
                 Event data for deleted file
         """
         file = event.src_path
-        if fnmatch(file, self.script_pattern):
+        if self.is_script(file):
             log.debug(
-                f"Gears script '{file}' deleted. "
-                "Scheduling de-registration of script."
+                "Gears script '%s' deleted. Scheduling de-registration of script.", file
             )
             # Apply hysteresis in case additional events shortly follow,
             # before we actually unregister
             self.file_index.signal(file, self.unregister_script, file)
-        elif fnmatch(file, self.requirements_pattern):
+        elif self.is_requirements(file):
             log.info(
-                f"Gears requirements file '{file}' deleted. "
+                "Gears requirements file '%s' deleted. "
                 "Requirement removal not Implemented. "
-                "Ignoring."
+                "Ignoring.",
+                file,
             )
         else:
-            log.warn(f"Unknown file type '{file}' deleted. " "Ignoring.")
+            log.warning("Unknown file type '%s' deleted. Ignoring.", file)
 
     def on_modified(self, event):
         """Watchdog event handler for events signalling that a
@@ -412,20 +915,20 @@ class GearsLoader:
                 Event data for modified file
         """
         file = event.src_path
-        if fnmatch(file, self.script_pattern):
-            log.debug(f"Gears script '{file}' modified. Regestering script.")
+        if self.is_script(file):
+            log.debug("Gears script '%s' modified. Regestering script.", file)
             # Apply hysteresis in case additional events shortly follow,
             # before we actually (re-)run/register the script.
             self.file_index.signal(file, self.register_script, file)
-        elif fnmatch(event.src_path, self.requirements_pattern):
+        elif self.is_requirements(event.src_path):
             log.debug(
-                f"Gears requirements file '{file}' modified. " "Updating dependencies."
+                "Gears requirements file '%s' modified. Updating dependencies.", file
             )
             # Apply hysteresis in case additional events shortly follow,
             # before we actually update requirements.
             self.file_index.signal(file, self.update_dependencies, file)
         else:
-            log.warn(f"Unknown file type '{event.src_path}' modified. Ignoring.")
+            log.warning("Unknown file type '%s' modified. Ignoring.", file)
 
     def on_moved(self, event):
         """Watchdog event handler for events signalling that a
@@ -441,42 +944,47 @@ class GearsLoader:
         old_file = event.src_path
         new_file = event.dest_path
         # Handle, i.e. unregister, the old / source file.
-        if fnmatch(old_file, self.script_pattern):
+        if self.is_script(old_file):
             log.debug(
-                f"Gears script '{old_file}' moved to '{new_file}'. "
-                "De-registering old script."
+                "Gears script '%s' moved to '%s'. De-registering old script.",
+                old_file,
+                new_file,
             )
             # Apply hysteresis in case additional events shortly follow,
             # before we actually unregister the script.
             self.file_index.signal(old_file, self.unregister_script, old_file)
-        elif fnmatch(old_file, self.requirements_pattern):
+        elif self.is_requirements(old_file):
             log.debug(
-                f"Gears requirements file '{old_file}' moved to '{new_file}'. "
+                "Gears requirements file '%s' moved to '%s'. "
                 "Requirement removal not Implemented. "
-                "Ignoring."
+                "Ignoring.",
+                old_file,
+                new_file,
             )
 
         # TODO: Check that the new file is in the watch directory
         # Handle, i.e. run/register, the new / destination file
-        if fnmatch(new_file, self.script_pattern):
+        if self.is_script(new_file):
             log.debug(
-                f"File '{old_file}' moved to Gears script '{new_file}'. "
-                "Registering new script."
+                "File '%s' moved to Gears script '%s'. Registering new script.",
+                old_file,
+                new_file,
             )
             # Apply hysteresis in case additional events shortly follow,
             # before we actually (re-)run/register the script
             self.file_index.signal(new_file, self.register_script, new_file)
-        elif fnmatch(new_file, self.requirements_pattern):
+        elif self.is_requirements(new_file):
             log.debug(
-                f"File '{old_file}' moved to requirements file '{new_file}'. "
-                "Updating dependencies"
+                "File '%s' moved to requirements file '%s'. Updating dependencies",
+                old_file,
+                new_file,
             )
             # Apply hysteresis in case additional events shortly follow,
             # before we actually update requirements.
             self.file_index.signal(new_file, self.update_dependencies, new_file)
         else:
-            log.warn(
-                f"File '{old_file}' moved to unknown type '{new_file}'. " "Ignoring."
+            log.warning(
+                "File '%s' moved to unknown type '%s'. Ignoring.", old_file, new_file
             )
 
     def start(self):
@@ -489,3 +997,14 @@ class GearsLoader:
         """Stop Loader monitoring."""
         if self.observer:
             self.observer.stop()
+
+    def join(self, timeout: Optional[float] = None):
+        """Wait until the Loader monitoring has stopped.
+
+        Args:
+            timeout (float, optional):
+                Maximum number of seconds to wait.
+                Defaults to None, i.e. wait indefinitely.
+        """
+        if self.observer:
+            self.observer.join(timeout)
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the log formatting.
+"""
+__author__ = "Anders Åström"
+__contact__ = "anders@lyngon.com"
+__copyright__ = "2021, Lyngon Pte. Ltd."
+__licence__ = """The MIT License
+Copyright © 2021 Lyngon Pte. Ltd.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this
+ software and associated documentation files (the “Software”), to deal in the Software
+ without restriction, including without limitation the rights to use, copy, modify,
+ merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+ permit persons to whom the Software is furnished to do so, subject to the following
+ conditions:
+
+The above copyright notice and this permission notice shall be included in all copies
+ or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+ INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+ PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+ HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF
+ CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE
+ OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+
+import logging
+import random
+from datetime import datetime
+
+import pytest
+
+from redgrease.formatting import UTC_ISO8601_Formatter, iso8601_datefmt
+
+timestamps = [
+    0.0,
+    1614556800.0,
+    1614556800.0000005,
+    1614556800.0000015,
+    1614556800.4999995,
+    1614556800.9999994,
+    1614556800.9999996,
+    1614556801.999999,
+]
+
+
+def record(created: float) -> logging.LogRecord:
+    log_record = logging.makeLogRecord({})
+    log_record.created = created
+    return log_record
+
+
+@pytest.mark.parametrize("created", timestamps)
+def test_format_time(created):
+    formatter = UTC_ISO8601_Formatter()
+
+    expected = datetime.utcfromtimestamp(created).strftime(iso8601_datefmt)
+    assert formatter.formatTime(record(created)) == expected
+    # Same second, i.e. cached
+    assert formatter.formatTime(record(created)) == expected
+
+
+def test_format_time_random():
+    formatter = UTC_ISO8601_Formatter()
+    randomizer = random.Random(0)
+
+    for _ in range(10000):
+        created = randomizer.uniform(0, 2000000000)
+        expected = datetime.utcfromtimestamp(created).strftime(iso8601_datefmt)
+        assert formatter.formatTime(record(created)) == expected
+
+
+def test_format_time_with_datefmt():
+    formatter = UTC_ISO8601_Formatter()
+
+    assert formatter.formatTime(record(0.0), "%Y") == "1970"
+
+
+def test_format_time_with_converter():
+    formatter = UTC_ISO8601_Formatter()
+    formatter.converter = lambda created: datetime(2021, 3, 1, 12)
+
+    assert formatter.formatTime(record(0.0)) == "2021-03-01T12:00:00.000000"
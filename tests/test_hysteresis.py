@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the handling of events that come in bursts.
+"""
+__author__ = "Anders Åström"
+__contact__ = "anders@lyngon.com"
+__copyright__ = "2021, Lyngon Pte. Ltd."
+__licence__ = """The MIT License
+Copyright © 2021 Lyngon Pte. Ltd.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this
+ software and associated documentation files (the “Software”), to deal in the Software
+ without restriction, including without limitation the rights to use, copy, modify,
+ merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+ permit persons to whom the Software is furnished to do so, subject to the following
+ conditions:
+
+The above copyright notice and this permission notice shall be included in all copies
+ or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+ INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+ PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+ HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF
+ CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE
+ OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import threading
+import time
+
+from redgrease.hysteresis import HysteresisHandlerBatch
+
+
+def test_batch_burst_fires_once():
+    batches = []
+    done = threading.Event()
+
+    def batch_handler(handlers):
+        batches.append(handlers)
+        done.set()
+
+    batch = HysteresisHandlerBatch(hysteresis_duration=0.2, batch_handler=batch_handler)
+    for i in range(10):
+        batch.signal(i, print, i)
+        time.sleep(0.01)
+
+    assert done.wait(timeout=5)
+    # Give any erroneous additional trigger a chance to happen
+    time.sleep(0.4)
+    assert len(batches) == 1
+    assert len(batches[0]) == 10
+    assert batch.pending == {}
+
+
+def test_batch_handler_receives_all_pending():
+    batches = []
+    batch = HysteresisHandlerBatch(hysteresis_duration=60, batch_handler=batches.append)
+
+    batch.signal("a", print, 1)
+    batch.signal("b", print, 2, 3, sep="-")
+    batch.trigger()
+
+    assert batches == [[(print, (1,), {}), (print, (2, 3), {"sep": "-"})]]
+
+
+def test_batch_signal_replaces_but_keeps_position():
+    batches = []
+    batch = HysteresisHandlerBatch(hysteresis_duration=60, batch_handler=batches.append)
+
+    batch.signal("a", print, "first a")
+    batch.signal("b", print, "b")
+    batch.signal("a", len, "second a")
+    batch.trigger()
+
+    assert batches == [[(len, ("second a",), {}), (print, ("b",), {})]]
+
+
+def test_batch_default_calls_handlers_in_order():
+    calls = []
+    batch = HysteresisHandlerBatch(hysteresis_duration=60)
+
+    batch.signal("x", calls.append, "x")
+    batch.signal("y", calls.append, "y")
+    batch.signal("z", calls.append, "z")
+    batch.signal("x", calls.append, "x2")
+    batch.trigger()
+
+    assert calls == ["x2", "y", "z"]
+
+
+def test_batch_trigger_without_signals_does_nothing():
+    batches = []
+    batch = HysteresisHandlerBatch(hysteresis_duration=60, batch_handler=batches.append)
+
+    batch.trigger()
+
+    assert batches == []
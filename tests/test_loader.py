@@ -0,0 +1,392 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the Gears script loader, using a stubbed Redis client.
+"""
+__author__ = "Anders Åström"
+__contact__ = "anders@lyngon.com"
+__copyright__ = "2021, Lyngon Pte. Ltd."
+__licence__ = """The MIT License
+Copyright © 2021 Lyngon Pte. Ltd.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this
+ software and associated documentation files (the “Software”), to deal in the Software
+ without restriction, including without limitation the rights to use, copy, modify,
+ merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+ permit persons to whom the Software is furnished to do so, subject to the following
+ conditions:
+
+The above copyright notice and this permission notice shall be included in all copies
+ or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+ INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+ PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+ HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF
+ CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE
+ OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+
+import os
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from redgrease import Gears, RedisCluster, requirements
+from redgrease.loader import GearsLoader
+
+
+class StubPipeline:
+    def __init__(self, client: "StubClient"):
+        self.client = client
+        self.commands: List[tuple] = []
+
+    def execute_command(self, *args):
+        self.commands.append(args)
+
+    def delete(self, key):
+        self.commands.append(("DEL", key))
+
+    def hget(self, key, field):
+        self.commands.append(("HGET", key, field))
+
+    def hset(self, key, mapping):
+        self.commands.append(("HSET", key, mapping))
+
+    def execute(self, raise_on_error=True):
+        self.client.pipelines.append([command[0] for command in self.commands])
+        return [self.client.execute_command(*command) for command in self.commands]
+
+
+class StubClient:
+    """Minimal stand-in for the RedisGears client, recording issued commands."""
+
+    def __init__(self):
+        self.commands: List[tuple] = []
+        self.registrations: List[str] = []
+        self.pipelines: List[List[str]] = []
+        self.index: Dict[str, Dict[str, str]] = {}
+        self.gears = Gears(self)
+
+    def set_response_callback(self, command, callback):
+        pass
+
+    def execute_command(self, command, *args) -> Any:
+        self.commands.append((command,) + args)
+        if command == "HGET":
+            return self.index.get(args[0], {}).get(args[1])
+        if command == "HSET":
+            self.index[args[0]] = args[1]
+        if command == "DEL":
+            self.index.pop(args[0], None)
+        if command == "RG.DUMPREGISTRATIONS":
+            return [SimpleNamespace(id=reg_id) for reg_id in self.registrations]
+        if command == "RG.PYEXECUTE" and "register" in str(args[0]):
+            self.registrations.append(f"reg-{len(self.commands)}")
+        return True
+
+    def delete(self, key):
+        return self.execute_command("DEL", key)
+
+    def hget(self, key, field):
+        return self.execute_command("HGET", key, field)
+
+    def hset(self, key, mapping):
+        return self.execute_command("HSET", key, mapping)
+
+    def pipeline(self, transaction=True):
+        return StubPipeline(self)
+
+    def close(self):
+        pass
+
+
+class StubClusterClient(StubClient, RedisCluster):
+    """Stand-in for a cluster client, which cannot pipeline keyless commands."""
+
+    gears = None  # Instead of the client property
+
+    def pipeline(self, transaction=None):
+        raise AssertionError("Cluster pipelines cannot route the Gears commands")
+
+
+@pytest.fixture
+def loader():
+    gears_loader = GearsLoader()
+    gears_loader.redis = StubClient()
+    return gears_loader
+
+
+def command_names(client: StubClient) -> List[str]:
+    return [command[0] for command in client.commands]
+
+
+def test_handle_batch_registers_last(loader: GearsLoader, tmp_path):
+    script_a = tmp_path / "a.py"
+    script_a.write_text("GB().register()")
+    script_b = tmp_path / "b.py"
+    script_b.write_text("GB().run()")
+    deleted_script = tmp_path / "deleted.py"
+    requirements_file = tmp_path / "requirements.txt"
+    requirements_file.write_text("numpy\nattrs\n")
+
+    loader.handle_batch(
+        [
+            (loader.register_script, (script_a,), {}),
+            (loader.unregister_script, (deleted_script,), {}),
+            (loader.register_script, (script_b,), {}),
+            (loader.update_dependencies, (requirements_file,), {}),
+        ]
+    )
+
+    client = loader.redis
+    assert command_names(client) == [
+        # Unregistration of the deleted script
+        "HGET",
+        "DEL",
+        # Requirements update
+        "RG.PYEXECUTE",
+        # Previous registration ids of both scripts
+        "HGET",
+        "HGET",
+        # Single registration pipeline for both scripts
+        "RG.DUMPREGISTRATIONS",
+        "DEL",
+        "DEL",
+        "RG.PYEXECUTE",
+        "RG.DUMPREGISTRATIONS",
+        "RG.PYEXECUTE",
+        "RG.DUMPREGISTRATIONS",
+        # Index of the registered script
+        "HSET",
+    ]
+    assert client.commands[2] == (
+        "RG.PYEXECUTE",
+        "",
+        "REQUIREMENTS",
+        "attrs",
+        "numpy",
+    )
+    assert client.commands[-1][1] == f"{loader.index_prefix}{script_a}"
+
+
+def test_register_ignores_registrations_by_others(loader: GearsLoader, tmp_path):
+    script = tmp_path / "script.py"
+    script.write_text("GB().register()")
+    client = loader.redis
+
+    loader.register_script(script)
+    assert loader._script_registrations[str(script)] == client.registrations[0]
+
+    # Registration by some other client, in between loads
+    client.registrations.append("reg-other")
+
+    script.write_text("GB().register()  # Modified")
+    loader.register_script(script)
+    assert loader._script_registrations[str(script)] == client.registrations[-1]
+    assert "reg-other" in client.registrations
+
+
+def test_register_with_cluster_client(loader: GearsLoader, tmp_path):
+    script = tmp_path / "script.py"
+    script.write_text("GB().register()")
+    loader.redis = client = StubClusterClient()
+
+    loader.register_script(script)
+    assert loader._script_registrations[str(script)] == client.registrations[0]
+
+    loader.unregister_script(script)
+    assert command_names(client)[-2:] == ["RG.UNREGISTER", "DEL"]
+    assert client.commands[-2][1] == client.registrations[0]
+
+
+def test_handle_batch_continues_after_failure(loader: GearsLoader, tmp_path):
+    script = tmp_path / "script.py"
+    script.write_text("GB().register()")
+    client = loader.redis
+
+    def fail_unregister(script_path):
+        raise ConnectionError("Connection refused")
+
+    loader.handle_batch(
+        [
+            (fail_unregister, (tmp_path / "deleted.py",), {}),
+            (loader.register_script, (script,), {}),
+        ]
+    )
+    assert loader._script_registrations[str(script)] == client.registrations[0]
+
+
+def test_read_script(loader: GearsLoader, tmp_path):
+    script = tmp_path / "script.py"
+    script_content = "GB().run()\n".encode() * 10000
+    script.write_bytes(script_content)
+
+    assert loader.read_script(script) == script_content
+
+
+@pytest.mark.parametrize(
+    "file_name, error",
+    [
+        ("missing.py", FileNotFoundError),
+        ("directory.py", FileNotFoundError),
+        ("empty.py", IOError),
+    ],
+)
+def test_read_script_errors(loader: GearsLoader, tmp_path, file_name, error):
+    (tmp_path / "directory.py").mkdir()
+    (tmp_path / "empty.py").touch()
+
+    with pytest.raises(error):
+        loader.read_script(tmp_path / file_name)
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="FIFOs not supported")
+def test_read_script_fifo(loader: GearsLoader, tmp_path):
+    fifo = tmp_path / "fifo.py"
+    os.mkfifo(fifo)
+
+    # Must fail without waiting for a writer
+    with pytest.raises(FileNotFoundError):
+        loader.read_script(fifo)
+
+
+def test_registration_ids_fetched_together(loader: GearsLoader, tmp_path):
+    scripts = [tmp_path / f"script_{i}.py" for i in range(3)]
+    for script in scripts:
+        script.write_text("GB().register()")
+
+    loader.register_scripts(*scripts)
+    assert loader.redis.pipelines[0] == ["HGET", "HGET", "HGET"]
+
+
+def test_register_scripts_logs_errors_once(loader: GearsLoader, tmp_path, caplog):
+    script = tmp_path / "script.py"
+    script.write_text("GB().register()")
+    missing_script = tmp_path / "missing.py"
+
+    loader.register_scripts(missing_script, script)
+
+    errors = [record for record in caplog.records if record.levelname == "ERROR"]
+    assert len(errors) == 1
+    assert str(missing_script) in errors[0].getMessage()
+    assert loader._script_registrations[str(script)] == loader.redis.registrations[0]
+
+
+def test_pyexecute_sorts_requirements(loader: GearsLoader):
+    client = loader.redis
+
+    client.gears.pyexecute("GB().run()", requirements=["numpy", "attrs", "Pillow"])
+    assert client.commands[-1] == (
+        "RG.PYEXECUTE",
+        "GB().run()",
+        "REQUIREMENTS",
+        "Pillow",
+        "attrs",
+        "numpy",
+    )
+
+
+def test_update_dependencies_unchanged(loader: GearsLoader, tmp_path):
+    requirements_file = tmp_path / "requirements.txt"
+    requirements_file.write_text("numpy\nattrs\n")
+    client = loader.redis
+
+    loader.update_dependencies(requirements_file)
+    loader.update_dependencies(requirements_file)
+    assert command_names(client) == ["RG.PYEXECUTE"]
+
+    requirements_file.write_text("numpy\nattrs\npandas\n")
+    loader.update_dependencies(requirements_file)
+    assert command_names(client) == ["RG.PYEXECUTE", "RG.PYEXECUTE"]
+
+
+def test_register_unchanged_script(loader: GearsLoader, tmp_path):
+    script = tmp_path / "script.py"
+    script.write_text("GB().register()")
+    client = loader.redis
+
+    loader.register_script(script)
+    executions = command_names(client).count("RG.PYEXECUTE")
+
+    # Touch-save, i.e. same contents
+    script.write_text("GB().register()")
+    loader.register_script(script)
+    assert command_names(client).count("RG.PYEXECUTE") == executions
+
+    # Deleted and re-created, with the same contents
+    loader.unregister_script(script)
+    loader.register_script(script)
+    assert command_names(client).count("RG.PYEXECUTE") == executions + 1
+
+
+def test_unregister_cached_registration(loader: GearsLoader, tmp_path):
+    script = tmp_path / "script.py"
+    script.write_text("GB().register()")
+    client = loader.redis
+
+    loader.register_script(script)
+    del client.commands[:]
+
+    loader.unregister_script(script)
+    assert command_names(client) == ["RG.UNREGISTER", "DEL"]
+    assert client.commands[0][1] == client.registrations[0]
+
+
+def test_unregister_indexed_registration(loader: GearsLoader, tmp_path):
+    script = tmp_path / "script.py"
+    script.write_text("GB().register()")
+    client = loader.redis
+    loader.register_script(script)
+
+    # Registered by a previous loader
+    loader = GearsLoader()
+    loader.redis = client
+    del client.commands[:]
+
+    loader.unregister_script(script)
+    assert command_names(client) == ["HGET", "RG.UNREGISTER", "DEL"]
+    assert client.commands[1][1] == client.registrations[0]
+
+
+def test_read_requirements_cached(loader: GearsLoader, tmp_path, monkeypatch):
+    requirements_file = tmp_path / "requirements.txt"
+    requirements_file.write_text("numpy\n")
+    parsed = []
+    read_requirements = requirements.read_requirements
+
+    def counting_read_requirements(path):
+        parsed.append(path)
+        return read_requirements(path)
+
+    monkeypatch.setattr(requirements, "read_requirements", counting_read_requirements)
+
+    assert loader._read_requirements(requirements_file) == {"numpy"}
+    assert loader._read_requirements(requirements_file) == {"numpy"}
+    assert len(parsed) == 1
+
+    # Changed size
+    requirements_file.write_text("numpy\nattrs\n")
+    assert loader._read_requirements(requirements_file) == {"numpy", "attrs"}
+    assert len(parsed) == 2
+
+    # Changed modification time only
+    file_stat = requirements_file.stat()
+    os.utime(requirements_file, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1))
+    loader._read_requirements(requirements_file)
+    assert len(parsed) == 3
+
+
+def test_add_directory_matches_case_insensitive(loader: GearsLoader, tmp_path):
+    (tmp_path / "Script.PY").write_text("GB().register()")
+    (tmp_path / "REQUIREMENTS.TXT").write_text("numpy\n")
+    (tmp_path / "directory.py").mkdir()
+    (tmp_path / "notes.txt").write_text("GB().register()")
+    client = loader.redis
+
+    loader.add_directory(tmp_path)
+    assert command_names(client).count("RG.PYEXECUTE") == 2
+    assert loader._requirements[str(tmp_path / "REQUIREMENTS.TXT")] == {"numpy"}
+    assert str(tmp_path / "Script.PY") in loader._script_registrations
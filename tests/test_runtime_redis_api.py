@@ -26,8 +26,11 @@ THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR I
  OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
+import fnmatch
+import functools
 import os
-from pathlib import Path
+import re
+from typing import List, Tuple
 
 import pytest
 
@@ -41,17 +44,23 @@ def gear_script(file):
     return os.path.join(scripts_dir, file)
 
 
-def gear_scripts(file_pattern):
-    directory = Path(str(scripts_dir))
-    return directory.rglob(file_pattern)
+@functools.lru_cache(maxsize=None)
+def gear_scripts(file_pattern: str) -> Tuple[str, ...]:
+    pattern = re.compile(fnmatch.translate(file_pattern))
+    return tuple(
+        os.path.join(root, name)
+        for root, _, names in os.walk(scripts_dir)
+        for name in names
+        if pattern.match(name)
+    )
 
 
-def read(file_pattern):
-    directory = Path(str(scripts_dir))
+@functools.lru_cache(maxsize=None)
+def read(file_pattern: str) -> List[Tuple[str, str]]:
     files_contents = []
-    for file_path in directory.rglob(file_pattern):
-        with open(file_path, "r") as file:
-            files_contents.append((file_path.name, file.read()))
+    for file_path in gear_scripts(file_pattern):
+        with open(file_path, "rb") as file:
+            files_contents.append((os.path.basename(file_path), file.read().decode()))
     return files_contents
 
 